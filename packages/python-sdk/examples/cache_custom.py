@@ -5,6 +5,9 @@ This example demonstrates:
 - Implementing a simple file-based cache as an example
 - Best practices for error handling in cache providers
 
+Install orjson for faster serialization (optional):
+  pip install orjson
+
 This serves as a template for implementing custom cache backends like:
 - Redis
 - Memcached
@@ -15,13 +18,34 @@ This serves as a template for implementing custom cache backends like:
 """
 
 import asyncio
-import json
+import hashlib
+import os
+import tempfile
 import time
 from pathlib import Path
 from typing import Any
 
 from lsbible import BookName, LSBibleClient
 
+# orjson is optional: it is much faster than the stdlib json module and
+# returns bytes directly, but the example works without it.
+# Both paths emit compact JSON (no indentation or padding whitespace).
+try:
+    import orjson
+
+    def json_dumps(value: Any) -> bytes:
+        # Accept non-string dict keys, like the stdlib json module does
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def json_dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    json_loads = json.loads
+
 
 class FileCacheProvider:
     """Example: File-based cache provider
@@ -36,7 +60,7 @@ class FileCacheProvider:
     async def init(self) -> None:
         """Initialize cache directory"""
         try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(self.cache_dir.mkdir, parents=True, exist_ok=True)
         except Exception as error:
             print(f"Failed to create cache directory: {error}")
 
@@ -45,25 +69,18 @@ class FileCacheProvider:
 
         Implementation notes:
         - Must return None if key doesn't exist
-        - Must handle expired entries (check TTL)
+        - Must handle expired entries (check TTL, here via the file's mtime)
         - Should handle errors gracefully (return None)
         - Must parse/deserialize the stored value
+        - Must not block the event loop (offload file I/O to a thread)
         """
         try:
             file_path = self._get_file_path(key)
-            content = file_path.read_text()
-            entry = json.loads(content)
-
-            # Check if expired
-            if entry.get("expires") and time.time() * 1000 > entry["expires"]:
-                # Delete expired entry
-                try:
-                    file_path.unlink()
-                except Exception:
-                    pass
+            content = await asyncio.to_thread(self._read, file_path)
+            if content is None:
                 return None
 
-            return entry["data"]
+            return json_loads(content)
         except Exception:
             # File doesn't exist or other error - return None
             return None
@@ -73,38 +90,78 @@ class FileCacheProvider:
 
         Implementation notes:
         - ttl is in seconds (convert to your storage format if needed)
+        - Here the expiry time is kept in the file's mtime, so the file holds
+          only the serialized value
         - Should handle errors gracefully (don't throw)
         - Must serialize the value appropriately
         - Should be async even if your storage is synchronous
+        - Should write atomically so readers never see partial entries
         """
         try:
             file_path = self._get_file_path(key)
-            entry = {
-                "data": value,
-                "expires": time.time() * 1000 + ttl * 1000,  # Convert seconds to milliseconds
-                "createdAt": time.time() * 1000,
-            }
+            expires_at = time.time() + ttl
 
-            file_path.write_text(json.dumps(entry, indent=2))
+            await asyncio.to_thread(self._write_atomic, file_path, json_dumps(value), expires_at)
         except Exception as error:
             print(f"Failed to set cache for key {key}: {error}")
 
+    @staticmethod
+    def _read(file_path: Path) -> bytes | None:
+        """Read a cache file (blocking, run in a worker thread)
+
+        The file's mtime holds its expiry time, so expired entries are
+        detected with a single stat() and deleted without being opened.
+        Returns None if the entry has expired.
+        """
+        if file_path.stat().st_mtime < time.time():
+            file_path.unlink(missing_ok=True)
+            return None
+
+        with open(file_path, "rb", buffering=64 * 1024) as f:
+            return f.read()
+
+    @staticmethod
+    def _write_atomic(file_path: Path, payload: bytes, expires_at: float) -> None:
+        """Write a cache file atomically (blocking, run in a worker thread)
+
+        Writes to a uniquely named temp file and renames it into place so a
+        crash mid-write never leaves a truncated cache file behind, and
+        concurrent writes to the same key never share a temp file. The expiry
+        time is stored as the file's mtime before the rename, so the entry
+        is never visible without it.
+        """
+        f = tempfile.NamedTemporaryFile(
+            dir=file_path.parent, suffix=".tmp", delete=False, buffering=256 * 1024
+        )
+        tmp_path = Path(f.name)
+        try:
+            # Closing flushes the buffer, so write errors can surface here too
+            with f:
+                f.write(payload)
+            os.utime(tmp_path, (time.time(), expires_at))
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def _get_file_path(self, key: str) -> Path:
         """Get file path for a cache key
-        Encodes the key to make it filesystem-safe
+        Hashes the key to a fixed-length, filesystem-safe, collision-free name
         """
-        # Simple encoding: replace special chars with underscores
-        safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
-        return self.cache_dir / f"{safe_key}.json"
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json"
 
     async def clear(self) -> None:
-        """Optional: Clear all cache entries"""
+        """Optional: Clear all cache entries (and temp files left by crashed writes)"""
         try:
-            for file in self.cache_dir.glob("*.json"):
-                try:
-                    file.unlink()
-                except Exception:
-                    pass
+            files = await asyncio.to_thread(
+                lambda: [*self.cache_dir.glob("*.json"), *self.cache_dir.glob("*.tmp")]
+            )
+            # Unlink in parallel; individual failures are ignored
+            await asyncio.gather(
+                *(asyncio.to_thread(file.unlink, missing_ok=True) for file in files),
+                return_exceptions=True,
+            )
         except Exception as error:
             print(f"Failed to clear cache: {error}")
 
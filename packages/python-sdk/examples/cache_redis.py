@@ -10,6 +10,9 @@ NOTE: This example requires Redis to be running and the redis package:
   # or
   poetry add redis[asyncio]
 
+Install orjson for faster serialization (optional):
+  pip install orjson
+
 Start Redis locally:
   docker run -d -p 6379:6379 redis:alpine
   # or
@@ -17,9 +20,28 @@ Start Redis locally:
 """
 
 import asyncio
-import json
+from collections.abc import Sequence
 from typing import Any
 
+# orjson is optional: it is much faster than the stdlib json module and
+# returns bytes directly, but the example works without it.
+# Both paths emit compact JSON (no indentation or padding whitespace).
+try:
+    import orjson
+
+    def json_dumps(value: Any) -> bytes:
+        # Accept non-string dict keys, like the stdlib json module does
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def json_dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    json_loads = json.loads
+
 # Uncomment after installing redis[asyncio]:
 # import redis.asyncio as redis
 
@@ -37,7 +59,7 @@ class RedisCacheProvider:
     async def get(self, key: str) -> Any | None:
         try:
             value = await self.redis.get(key)
-            return json.loads(value) if value else None
+            return json_loads(value) if value else None
         except Exception as error:
             print(f"Redis get error for key {key}: {error}")
             return None
@@ -45,10 +67,29 @@ class RedisCacheProvider:
     async def set(self, key: str, value: Any, ttl: int) -> None:
         try:
             # Store with expiration (ex = seconds)
-            await self.redis.set(key, json.dumps(value), ex=ttl)
+            await self.redis.set(key, json_dumps(value), ex=ttl)
         except Exception as error:
             print(f"Redis set error for key {key}: {error}")
 
+    async def mget(self, keys: Sequence[str]) -> list[Any | None]:
+        """Optional batch read: one round trip for all keys"""
+        try:
+            values = await self.redis.mget(keys)
+            return [json_loads(value) if value else None for value in values]
+        except Exception as error:
+            print(f"Redis mget error: {error}")
+            return [None] * len(keys)
+
+    async def mset(self, entries: Sequence[tuple[str, Any, int]]) -> None:
+        """Optional batch write: pipeline all SETs into one round trip"""
+        try:
+            pipe = self.redis.pipeline()
+            for key, value, ttl in entries:
+                pipe.set(key, json_dumps(value), ex=ttl)
+            await pipe.execute()
+        except Exception as error:
+            print(f"Redis mset error: {error}")
+
 
 async def main():
     print("=== LSBible SDK - Redis Cache Example ===\n")
@@ -7,6 +7,7 @@ from .cache import (
     CacheTTLConfig,
     MemoryCacheProvider,
     NoopCacheProvider,
+    TieredCacheProvider,
 )
 from .client import LSBibleClient
 from .exceptions import APIError, BuildIDError, InvalidReferenceError, LSBibleError
@@ -45,4 +46,5 @@ __all__ = [
     "CacheTTLConfig",
     "MemoryCacheProvider",
     "NoopCacheProvider",
+    "TieredCacheProvider",
 ]
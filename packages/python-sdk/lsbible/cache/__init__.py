@@ -1,6 +1,11 @@
 """Cache providers and configuration for LSBible SDK."""
 
 from lsbible.cache.interface import (
+    BIBLE_CONTENT_TTL,
+    NOT_FOUND_TTL,
+    SEARCH_RESULTS_TTL,
+    STATIC_TTL,
+    BatchCacheProvider,
     CacheOptions,
     CacheProvider,
     CacheTTL,
@@ -8,12 +13,19 @@ from lsbible.cache.interface import (
 )
 from lsbible.cache.memory import MemoryCacheProvider
 from lsbible.cache.noop import NoopCacheProvider
+from lsbible.cache.tiered import TieredCacheProvider
 
 __all__ = [
+    "BIBLE_CONTENT_TTL",
+    "NOT_FOUND_TTL",
+    "SEARCH_RESULTS_TTL",
+    "STATIC_TTL",
+    "BatchCacheProvider",
     "CacheOptions",
     "CacheProvider",
     "CacheTTL",
     "CacheTTLConfig",
     "MemoryCacheProvider",
     "NoopCacheProvider",
+    "TieredCacheProvider",
 ]
@@ -4,7 +4,20 @@ Allows users to implement custom caching strategies for different
 deployment environments (Redis, Memcached, in-memory, etc.)
 """
 
-from typing import Any, Protocol, TypedDict
+from collections.abc import Sequence
+from typing import Any, Final, Protocol, TypedDict
+
+BIBLE_CONTENT_TTL: Final[int] = 2_592_000
+"""1 month - for immutable Bible content (verses, passages, chapters)"""
+
+SEARCH_RESULTS_TTL: Final[int] = 604_800
+"""1 week - for search results that may change with API updates"""
+
+STATIC_TTL: Final[int] = 31_536_000
+"""1 year - for static resources that never change"""
+
+NOT_FOUND_TTL: Final[int] = 60
+"""1 minute - for lookups that returned no results"""
 
 
 class CacheProvider(Protocol):
@@ -51,6 +64,49 @@ class CacheProvider(Protocol):
         ...
 
 
+class BatchCacheProvider(CacheProvider, Protocol):
+    """Cache provider that can read and write many keys in one call.
+
+    Optional extension of CacheProvider for backends where each call costs a
+    network round trip. Callers detect support with ``hasattr(provider, "mget")``.
+
+    Example:
+        ```python
+        class RedisCacheProvider:
+            ...
+
+            async def mget(self, keys: Sequence[str]) -> list[Any | None]:
+                values = await self.redis.mget(keys)
+                return [json.loads(v) if v else None for v in values]
+
+            async def mset(self, entries: Sequence[tuple[str, Any, int]]) -> None:
+                pipe = self.redis.pipeline()
+                for key, value, ttl in entries:
+                    pipe.set(key, json.dumps(value), ex=ttl)
+                await pipe.execute()
+        ```
+    """
+
+    async def mget(self, keys: Sequence[str]) -> list[Any | None]:
+        """Get several values from the cache.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order, None for keys not found/expired
+        """
+        ...
+
+    async def mset(self, entries: Sequence[tuple[str, Any, int]]) -> None:
+        """Set several values in the cache.
+
+        Args:
+            entries: (key, value, ttl) tuples, with ttl in seconds
+        """
+        ...
+
+
 class CacheTTLConfig(TypedDict, total=False):
     """Per-operation TTL overrides."""
 
@@ -66,6 +122,9 @@ class CacheTTLConfig(TypedDict, total=False):
     search: int
     """TTL for search queries"""
 
+    not_found: int
+    """Maximum TTL for responses with no results (caps the per-operation TTL)"""
+
 
 class CacheOptions(TypedDict, total=False):
     """Cache configuration options."""
@@ -90,11 +149,14 @@ class CacheOptions(TypedDict, total=False):
 class CacheTTL:
     """Recommended cache TTL values (in seconds)."""
 
-    BIBLE_CONTENT: int = 2_592_000
+    BIBLE_CONTENT: int = BIBLE_CONTENT_TTL
     """1 month - for immutable Bible content (verses, passages, chapters)"""
 
-    SEARCH_RESULTS: int = 604_800
+    SEARCH_RESULTS: int = SEARCH_RESULTS_TTL
     """1 week - for search results that may change with API updates"""
 
-    STATIC: int = 31_536_000
+    STATIC: int = STATIC_TTL
     """1 year - for static resources that never change"""
+
+    NOT_FOUND: int = NOT_FOUND_TTL
+    """1 minute - for lookups that returned no results"""
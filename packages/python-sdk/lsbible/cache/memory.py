@@ -1,14 +1,63 @@
 """In-memory cache provider with TTL support."""
 
-import time
+import asyncio
+import contextlib
+import sys
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from time import monotonic
 from typing import Any
 
 
+@dataclass(slots=True)
+class _Entry:
+    """Cached value with its expiry deadline (on the monotonic clock)."""
+
+    expires_at: float
+    value: Any
+    size: int = 0
+
+
+def _deep_sizeof(value: Any) -> int:
+    """Estimate the memory footprint of a value, including nested containers.
+
+    Walks dicts, lists, tuples and sets (as produced by JSON decoding), counting
+    each object once.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+    return total
+
+
 class MemoryCacheProvider:
     """In-memory cache provider using dictionary with TTL support.
 
     This cache stores entries in memory with automatic expiration based on TTL.
-    Expired entries are removed lazily when accessed.
+    Expired entries are removed lazily when accessed, and a background task
+    periodically sweeps out expired entries that are never read again. When
+    ``max_size`` is set, the least recently used entry is evicted once the cache
+    grows past it. ``max_bytes`` does the same for the estimated total size of
+    the cached values.
 
     Suitable for:
     - Local development and testing
@@ -21,6 +70,11 @@ class MemoryCacheProvider:
     - High-traffic production servers (use Redis/Memcached)
     - Serverless deployments with limited memory
 
+    Concurrency: the cache takes no locks. Every mutation is a synchronous
+    OrderedDict operation with no await in between, so under asyncio's
+    single-threaded event loop no other task can observe a partial update.
+    Do not share an instance across threads.
+
     Example:
         ```python
         from lsbible import LSBibleClient, MemoryCacheProvider, CacheTTL
@@ -37,9 +91,42 @@ class MemoryCacheProvider:
         ```
     """
 
-    def __init__(self) -> None:
-        """Initialize the memory cache."""
-        self._cache: dict[str, tuple[Any, float]] = {}
+    __slots__ = (
+        "_cache",
+        "_max_size",
+        "_sweep_interval",
+        "_sweeper",
+        "_max_bytes",
+        "_sizeof",
+        "_bytes",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        sweep_interval: float | None = 60.0,
+        max_bytes: int | None = None,
+        sizeof: Callable[[Any], int] | None = None,
+    ) -> None:
+        """Initialize the memory cache.
+
+        Args:
+            max_size: Maximum number of entries to keep (None for unbounded)
+            sweep_interval: Seconds between background sweeps of expired entries
+                (None to disable the sweeper)
+            max_bytes: Maximum estimated total size of cached values in bytes
+                (None for unbounded). Larger single values are not cached.
+            sizeof: Function estimating a value's size in bytes (defaults to a
+                recursive sys.getsizeof walk). Only used when max_bytes is set.
+        """
+        self._cache: OrderedDict[str, _Entry] = OrderedDict()
+        self._max_size = max_size
+        self._sweep_interval = sweep_interval
+        self._sweeper: asyncio.Task[None] | None = None
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof or _deep_sizeof
+        self._bytes = 0
 
     async def get(self, key: str) -> Any | None:
         """Get a value from the cache.
@@ -50,29 +137,171 @@ class MemoryCacheProvider:
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        if key not in self._cache:
-            return None
+        return self.get_nowait(key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Set a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        self.set_nowait(key, value, ttl)
+
+    async def mget(self, keys: Sequence[str]) -> list[Any | None]:
+        """Get several values from the cache.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order, None for keys not found/expired
+        """
+        return [self.get_nowait(key) for key in keys]
+
+    async def mset(self, entries: Sequence[tuple[str, Any, int]]) -> None:
+        """Set several values in the cache.
+
+        Args:
+            entries: (key, value, ttl) tuples, with ttl in seconds
+        """
+        for key, value, ttl in entries:
+            self.set_nowait(key, value, ttl)
+
+    def get_nowait(self, key: str) -> Any | None:
+        """Get a value from the cache without awaiting.
+
+        Synchronous counterpart of get(), used by the client to skip
+        coroutine overhead on in-process cache hits.
 
-        value, expires_at = self._cache[key]
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found and not expired, None otherwise
+        """
+        cache = self._cache
+
+        # Single lookup; stored entries are never None, so None means a miss
+        entry = cache.get(key)
+        if entry is None:
+            return None
 
         # Check if expired
-        if time.time() > expires_at:
+        if monotonic() > entry.expires_at:
             # Expired, remove from cache
-            del self._cache[key]
+            del cache[key]
+            self._bytes -= entry.size
             return None
 
-        return value
+        # Mark as most recently used
+        cache.move_to_end(key)
+        return entry.value
 
-    async def set(self, key: str, value: Any, ttl: int) -> None:
-        """Set a value in the cache.
+    def set_nowait(self, key: str, value: Any, ttl: int) -> None:
+        """Set a value in the cache without awaiting.
+
+        Synchronous counterpart of set().
 
         Args:
             key: Cache key
             value: Value to cache
             ttl: Time to live in seconds
         """
-        expires_at = time.time() + ttl
-        self._cache[key] = (value, expires_at)
+        # (Re)start the sweeper; a done task belongs to a loop that has shut down
+        sweeper = self._sweeper
+        if self._sweep_interval is not None and (sweeper is None or sweeper.done()):
+            self._start_sweeper(self._sweep_interval)
+
+        cache = self._cache
+        expires_at = monotonic() + ttl
+        max_bytes = self._max_bytes
+        size = self._sizeof(value) if max_bytes is not None else 0
+
+        # A value that can never fit is not cached, rather than flushing every
+        # other entry; any stale value under the same key is dropped
+        if max_bytes is not None and size > max_bytes:
+            stale = cache.pop(key, None)
+            if stale is not None:
+                self._bytes -= stale.size
+            return
+
+        entry = cache.get(key)
+        if entry is None:
+            cache[key] = _Entry(expires_at, value, size)
+            self._bytes += size
+        else:
+            # Overwrite in place to avoid allocating a new entry
+            self._bytes += size - entry.size
+            entry.expires_at = expires_at
+            entry.value = value
+            entry.size = size
+            cache.move_to_end(key)
+
+        # Evict least recently used entries when over capacity
+        max_size = self._max_size
+        if max_size and len(cache) > max_size:
+            self._bytes -= cache.popitem(last=False)[1].size
+        if max_bytes is not None:
+            while self._bytes > max_bytes and cache:
+                self._bytes -= cache.popitem(last=False)[1].size
+
+    def _start_sweeper(self, interval: float) -> None:
+        """Start the sweeper task if an event loop is running.
+
+        Args:
+            interval: Seconds to wait between sweeps
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop yet; retry on the next set
+            return
+
+        self._sweeper = loop.create_task(self._sweep_loop(weakref.ref(self), interval))
+
+    @staticmethod
+    async def _sweep_loop(cache_ref: "weakref.ref[MemoryCacheProvider]", interval: float) -> None:
+        """Periodically remove expired entries from the cache.
+
+        Holds only a weak reference, so a cache dropped without aclose() can
+        still be garbage collected; the loop exits once it is gone.
+
+        Args:
+            cache_ref: Weak reference to the cache to sweep
+            interval: Seconds to wait between sweeps
+        """
+        while True:
+            await asyncio.sleep(interval)
+            cache = cache_ref()
+            if cache is None:
+                return
+            cache._sweep_expired()
+            # Don't keep the cache alive while sleeping
+            del cache
+
+    def _sweep_expired(self) -> None:
+        """Remove all expired entries from the cache."""
+        now = monotonic()
+        expired = [key for key, entry in self._cache.items() if entry.expires_at < now]
+        for key in expired:
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    async def aclose(self) -> None:
+        """Stop the background sweeper task.
+
+        The sweeper is restarted automatically on the next set().
+        """
+        if self._sweeper is None:
+            return
+
+        self._sweeper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._sweeper
+        self._sweeper = None
 
     def clear(self) -> None:
         """Clear all cached values.
@@ -80,6 +309,7 @@ class MemoryCacheProvider:
         Note: This is a synchronous method for convenience.
         """
         self._cache.clear()
+        self._bytes = 0
 
     def size(self) -> int:
         """Get the number of items currently in the cache.
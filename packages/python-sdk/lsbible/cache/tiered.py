@@ -0,0 +1,133 @@
+"""Two-tier cache provider with an in-process LRU in front of another provider."""
+
+from collections.abc import Sequence
+from typing import Any
+
+from lsbible.cache.interface import CacheProvider
+from lsbible.cache.memory import MemoryCacheProvider
+
+
+class TieredCacheProvider:
+    """Cache provider that keeps recently used values in process memory.
+
+    Wraps any other cache provider (Redis, file system, etc.) with a small
+    in-process LRU tier. Hits on the in-process tier return the already
+    deserialized Python object, skipping the network round trip and JSON decode
+    of the inner provider. Writes go through to both tiers.
+
+    The inner provider may drop entries on its own (eviction, another process
+    clearing a shared Redis), so every entry is kept in the in-process tier for
+    at most ``l1_ttl`` seconds, whether it was written or read through.
+
+    Example:
+        ```python
+        from lsbible import LSBibleClient, TieredCacheProvider
+
+        client = LSBibleClient(
+            cache={"provider": TieredCacheProvider(RedisCacheProvider(redis_client))}
+        )
+        ```
+    """
+
+    def __init__(self, inner: CacheProvider, l1_size: int = 256, l1_ttl: int = 300) -> None:
+        """Initialize the tiered cache.
+
+        Args:
+            inner: Cache provider backing the in-process tier
+            l1_size: Maximum number of entries kept in process memory
+            l1_ttl: Maximum seconds to keep an entry in process memory
+        """
+        self._inner = inner
+        self._l1 = MemoryCacheProvider(max_size=l1_size, sweep_interval=None)
+        self._l1_ttl = l1_ttl
+
+    async def get(self, key: str) -> Any | None:
+        """Get a value from the cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value if found in either tier, None otherwise
+        """
+        value = self._l1.get_nowait(key)
+        if value is not None:
+            return value
+
+        value = await self._inner.get(key)
+        if value is not None:
+            self._l1.set_nowait(key, value, self._l1_ttl)
+
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        """Set a value in both cache tiers.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        await self._inner.set(key, value, ttl)
+        self._l1.set_nowait(key, value, min(ttl, self._l1_ttl))
+
+    async def mget(self, keys: Sequence[str]) -> list[Any | None]:
+        """Get several values, fetching in-process misses from the inner provider.
+
+        Misses are fetched with a single ``inner.mget`` call when the inner
+        provider supports batching, otherwise one ``get`` per key.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order, None for keys not found in either tier
+        """
+        values = [self._l1.get_nowait(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+
+        missing_keys = [keys[i] for i in missing]
+        if hasattr(self._inner, "mget"):
+            fetched = await self._inner.mget(missing_keys)
+        else:
+            fetched = [await self._inner.get(key) for key in missing_keys]
+
+        for i, key, value in zip(missing, missing_keys, fetched, strict=True):
+            if value is not None:
+                values[i] = value
+                self._l1.set_nowait(key, value, self._l1_ttl)
+
+        return values
+
+    async def mset(self, entries: Sequence[tuple[str, Any, int]]) -> None:
+        """Set several values in both cache tiers.
+
+        Args:
+            entries: (key, value, ttl) tuples, with ttl in seconds
+        """
+        if hasattr(self._inner, "mset"):
+            await self._inner.mset(entries)
+        else:
+            for key, value, ttl in entries:
+                await self._inner.set(key, value, ttl)
+
+        l1_ttl = self._l1_ttl
+        for key, value, ttl in entries:
+            self._l1.set_nowait(key, value, min(ttl, l1_ttl))
+
+    def clear(self) -> None:
+        """Clear the in-process tier.
+
+        Note: The inner provider is left untouched; clear it directly.
+        """
+        self._l1.clear()
+
+    def size(self) -> int:
+        """Get the number of items currently in the in-process tier.
+
+        Returns:
+            Number of items in the in-process tier
+        """
+        return self._l1.size()
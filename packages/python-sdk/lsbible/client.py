@@ -3,17 +3,35 @@
 import platform
 import re
 import sys
+from enum import IntEnum
 from typing import Any
 
 import httpx
 
-from .cache import CacheOptions, CacheProvider, CacheTTL
+from .cache import (
+    BIBLE_CONTENT_TTL,
+    NOT_FOUND_TTL,
+    SEARCH_RESULTS_TTL,
+    CacheOptions,
+    CacheProvider,
+    MemoryCacheProvider,
+)
 from .exceptions import APIError, BuildIDError
 from .models import BookName, Passage, SearchResponse, VerseReference
 from .parser import PassageParser
 from .validators import BookValidator, ReferenceValidator
 
 
+class _CacheOp(IntEnum):
+    """Index of each operation's TTL in LSBibleClient._cache_ttls."""
+
+    VERSE = 0
+    PASSAGE = 1
+    CHAPTER = 2
+    SEARCH = 3
+    NOT_FOUND = 4
+
+
 def _get_user_agent() -> str:
     """
     Build User-Agent string for SDK requests.
@@ -90,20 +108,19 @@ class LSBibleClient:
 
         # Setup cache
         self._cache_provider: CacheProvider | None = cache.get("provider") if cache else None
-        self._cache_ttls = {
-            "verse": cache.get("ttl", {}).get("verse", CacheTTL.BIBLE_CONTENT)
-            if cache
-            else CacheTTL.BIBLE_CONTENT,
-            "passage": cache.get("ttl", {}).get("passage", CacheTTL.BIBLE_CONTENT)
-            if cache
-            else CacheTTL.BIBLE_CONTENT,
-            "chapter": cache.get("ttl", {}).get("chapter", CacheTTL.BIBLE_CONTENT)
-            if cache
-            else CacheTTL.BIBLE_CONTENT,
-            "search": cache.get("ttl", {}).get("search", CacheTTL.SEARCH_RESULTS)
-            if cache
-            else CacheTTL.SEARCH_RESULTS,
-        }
+
+        # Resolve per-operation TTLs once, indexed by _CacheOp
+        ttl = cache.get("ttl", {}) if cache else {}
+        default_ttl = cache.get("default_ttl") if cache else None
+        content_ttl = BIBLE_CONTENT_TTL if default_ttl is None else default_ttl
+        search_ttl = SEARCH_RESULTS_TTL if default_ttl is None else default_ttl
+        self._cache_ttls: tuple[int, ...] = (
+            ttl.get("verse", content_ttl),
+            ttl.get("passage", content_ttl),
+            ttl.get("chapter", content_ttl),
+            ttl.get("search", search_ttl),
+            ttl.get("not_found", NOT_FOUND_TTL),
+        )
 
         self._build_id = build_id
         self._build_id_fetched = build_id is not None
@@ -112,6 +129,10 @@ class LSBibleClient:
         """
         Cache wrapper helper method.
 
+        Responses without results are cached for at most the "not_found" TTL,
+        so repeated requests for missing content are served from the cache
+        without pinning a stale negative result for the full TTL.
+
         Args:
             key: Cache key
             ttl: Time to live in seconds
@@ -120,12 +141,25 @@ class LSBibleClient:
         Returns:
             Cached or freshly fetched data
         """
+        provider = self._cache_provider
+
         # If no cache provider, skip caching
-        if not self._cache_provider:
+        if not provider:
             return await fetcher()
 
+        # In-process cache: skip coroutine overhead on the hot path. Exact type
+        # check, so subclasses overriding get/set are still awaited below.
+        if type(provider) is MemoryCacheProvider:
+            cached = provider.get_nowait(key)
+            if cached is not None:
+                return cached
+
+            data = await fetcher()
+            provider.set_nowait(key, data, self._cache_ttl_for(data, ttl))
+            return data
+
         # Try to get from cache
-        cached = await self._cache_provider.get(key)
+        cached = await provider.get(key)
         if cached is not None:
             return cached
 
@@ -133,10 +167,26 @@ class LSBibleClient:
         data = await fetcher()
 
         # Store in cache
-        await self._cache_provider.set(key, data, ttl)
+        await provider.set(key, data, self._cache_ttl_for(data, ttl))
 
         return data
 
+    def _cache_ttl_for(self, data: dict, ttl: int) -> int:
+        """
+        Get the TTL to cache a response with.
+
+        Args:
+            data: Raw API response
+            ttl: TTL for the operation, in seconds
+
+        Returns:
+            ttl, capped at the "not_found" TTL if the response has no results
+        """
+        page_props = data.get("pageProps", {})
+        if page_props.get("passages") or page_props.get("initialItems"):
+            return ttl
+        return min(ttl, self._cache_ttls[_CacheOp.NOT_FOUND])
+
     async def _get_build_id(self) -> str:
         """
         Get the Next.js build ID.
@@ -398,7 +448,7 @@ class LSBibleClient:
         # Use cache with search-specific TTL and cache key
         cache_key = f"search:{query}"
         data = await self._with_cache(
-            cache_key, self._cache_ttls["search"], lambda: self._fetch_data(query)
+            cache_key, self._cache_ttls[_CacheOp.SEARCH], lambda: self._fetch_data(query)
         )
         return self._parse_response(data, query)
 
@@ -435,7 +485,7 @@ class LSBibleClient:
 
         # Fetch with caching
         data = await self._with_cache(
-            cache_key, self._cache_ttls["verse"], lambda: self._fetch_data(query)
+            cache_key, self._cache_ttls[_CacheOp.VERSE], lambda: self._fetch_data(query)
         )
 
         response = self._parse_response(data, query)
@@ -505,7 +555,7 @@ class LSBibleClient:
 
         # Fetch with caching
         data = await self._with_cache(
-            cache_key, self._cache_ttls["passage"], lambda: self._fetch_data(query)
+            cache_key, self._cache_ttls[_CacheOp.PASSAGE], lambda: self._fetch_data(query)
         )
 
         response = self._parse_response(data, query)
@@ -549,7 +599,7 @@ class LSBibleClient:
 
         # Fetch with caching
         data = await self._with_cache(
-            cache_key, self._cache_ttls["chapter"], lambda: self._fetch_data(query)
+            cache_key, self._cache_ttls[_CacheOp.CHAPTER], lambda: self._fetch_data(query)
         )
 
         response = self._parse_response(data, query)
@@ -566,8 +616,16 @@ class LSBibleClient:
             self._cache_provider.clear()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """
+        Close the HTTP client.
+
+        Also stops the background sweeper of a MemoryCacheProvider (it restarts
+        on the next write). Other cache providers are owned by the caller and
+        are left open.
+        """
         await self._client.aclose()
+        if isinstance(self._cache_provider, MemoryCacheProvider):
+            await self._cache_provider.aclose()
 
     async def __aenter__(self):
         """Async context manager entry."""
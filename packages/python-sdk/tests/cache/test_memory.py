@@ -1,5 +1,8 @@
 """Tests for MemoryCacheProvider."""
 
+import asyncio
+import gc
+import weakref
 from unittest.mock import patch
 
 import pytest
@@ -72,7 +75,7 @@ class TestMemoryCacheProvider:
         cache = MemoryCacheProvider()
 
         # Mock time to control expiration
-        with patch("time.time") as mock_time:
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
             # Set value at time 0
             mock_time.return_value = 0
             await cache.set("key", "value", ttl=1)
@@ -90,7 +93,7 @@ class TestMemoryCacheProvider:
         """Test that expired entries are removed from cache."""
         cache = MemoryCacheProvider()
 
-        with patch("time.time") as mock_time:
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
             mock_time.return_value = 0
             await cache.set("key", "value", ttl=1)
             assert cache.size() == 1
@@ -105,7 +108,7 @@ class TestMemoryCacheProvider:
         """Test multiple entries with independent expiration."""
         cache = MemoryCacheProvider()
 
-        with patch("time.time") as mock_time:
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
             # Set first entry at time 0 with 2 second TTL
             mock_time.return_value = 0
             await cache.set("key1", "value1", ttl=2)
@@ -152,7 +155,7 @@ class TestMemoryCacheProvider:
         """Test cache with zero TTL expires immediately."""
         cache = MemoryCacheProvider()
 
-        with patch("time.time") as mock_time:
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
             mock_time.return_value = 0
             await cache.set("key", "value", ttl=0)
 
@@ -165,7 +168,7 @@ class TestMemoryCacheProvider:
         """Test that each entry can have its own TTL."""
         cache = MemoryCacheProvider()
 
-        with patch("time.time") as mock_time:
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
             mock_time.return_value = 0
             await cache.set("short", "value1", ttl=1)  # 1 second
             await cache.set("long", "value2", ttl=10)  # 10 seconds
@@ -183,3 +186,254 @@ class TestMemoryCacheProvider:
             # At 10.5 seconds, both should be expired
             mock_time.return_value = 10.5
             assert await cache.get("long") is None
+
+    @pytest.mark.asyncio
+    async def test_cache_max_size_evicts_oldest(self):
+        """Test that the oldest entry is evicted when max_size is exceeded."""
+        cache = MemoryCacheProvider(max_size=2)
+
+        await cache.set("key1", "value1", ttl=60)
+        await cache.set("key2", "value2", ttl=60)
+        await cache.set("key3", "value3", ttl=60)
+
+        assert cache.size() == 2
+        assert await cache.get("key1") is None
+        assert await cache.get("key2") == "value2"
+        assert await cache.get("key3") == "value3"
+
+    @pytest.mark.asyncio
+    async def test_cache_max_size_evicts_least_recently_used(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = MemoryCacheProvider(max_size=2)
+
+        await cache.set("key1", "value1", ttl=60)
+        await cache.set("key2", "value2", ttl=60)
+
+        # Touch key1 so key2 becomes least recently used
+        assert await cache.get("key1") == "value1"
+
+        await cache.set("key3", "value3", ttl=60)
+
+        assert await cache.get("key1") == "value1"
+        assert await cache.get("key2") is None
+        assert await cache.get("key3") == "value3"
+
+    @pytest.mark.asyncio
+    async def test_cache_sweeper_removes_expired_entries(self):
+        """Test that the background sweeper removes expired entries without access."""
+        cache = MemoryCacheProvider(sweep_interval=0.01)
+
+        await cache.set("key", "value", ttl=0)
+        assert cache.size() == 1
+
+        await asyncio.sleep(0.05)
+        assert cache.size() == 0
+
+        await cache.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_aclose_stops_sweeper(self):
+        """Test that aclose() cancels the sweeper task."""
+        cache = MemoryCacheProvider(sweep_interval=60)
+
+        await cache.set("key", "value", ttl=60)
+        sweeper = cache._sweeper
+        assert sweeper is not None
+
+        await cache.aclose()
+        assert sweeper.cancelled()
+        assert cache._sweeper is None
+
+    @pytest.mark.asyncio
+    async def test_cache_sweeper_does_not_keep_cache_alive(self):
+        """Test that a cache dropped without aclose() is freed and its sweeper exits."""
+        cache = MemoryCacheProvider(sweep_interval=0.01)
+        await cache.set("key", "value", ttl=60)
+        sweeper = cache._sweeper
+        assert sweeper is not None
+        cache_ref = weakref.ref(cache)
+
+        del cache
+        gc.collect()
+        assert cache_ref() is None
+
+        await asyncio.sleep(0.05)
+        assert sweeper.done()
+
+    @pytest.mark.asyncio
+    async def test_cache_sweeper_disabled(self):
+        """Test that no sweeper is started when sweep_interval is None."""
+        cache = MemoryCacheProvider(sweep_interval=None)
+
+        await cache.set("key", "value", ttl=60)
+        assert cache._sweeper is None
+
+    @pytest.mark.asyncio
+    async def test_cache_ignores_wall_clock_jumps(self):
+        """Test that TTL tracking is unaffected by wall-clock changes."""
+        cache = MemoryCacheProvider(sweep_interval=None)
+        await cache.set("key", "value", ttl=60)
+
+        # Jump the wall clock forward a year
+        with patch("time.time", return_value=10**10):
+            assert await cache.get("key") == "value"
+
+    def test_cache_nowait_methods(self):
+        """Test synchronous get_nowait/set_nowait outside an event loop."""
+        cache = MemoryCacheProvider()
+
+        cache.set_nowait("key", "value", ttl=60)
+        assert cache.get_nowait("key") == "value"
+        assert cache.get_nowait("missing") is None
+
+        # No running loop, so the sweeper is deferred
+        assert cache._sweeper is None
+
+    @pytest.mark.asyncio
+    async def test_cache_nowait_shares_storage_with_async_methods(self):
+        """Test that sync and async accessors see the same entries."""
+        cache = MemoryCacheProvider(sweep_interval=None)
+
+        cache.set_nowait("key1", "value1", ttl=60)
+        await cache.set("key2", "value2", ttl=60)
+
+        assert await cache.get("key1") == "value1"
+        assert cache.get_nowait("key2") == "value2"
+
+    @pytest.mark.asyncio
+    async def test_cache_mget_and_mset(self):
+        """Test batch reads and writes."""
+        cache = MemoryCacheProvider(sweep_interval=None)
+
+        await cache.mset([("key1", "value1", 60), ("key2", "value2", 60)])
+
+        assert await cache.mget(["key1", "missing", "key2"]) == ["value1", None, "value2"]
+
+    @pytest.mark.asyncio
+    async def test_cache_overwrite_refreshes_recency_and_ttl(self):
+        """Test that overwriting a key updates its TTL and LRU position."""
+        cache = MemoryCacheProvider(max_size=2, sweep_interval=None)
+
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
+            mock_time.return_value = 0
+            await cache.set("key1", "value1", ttl=1)
+            await cache.set("key2", "value2", ttl=60)
+            await cache.set("key1", "updated", ttl=60)
+            await cache.set("key3", "value3", ttl=60)
+
+            mock_time.return_value = 5
+            assert await cache.get("key1") == "updated"
+            assert await cache.get("key2") is None
+            assert await cache.get("key3") == "value3"
+
+    def test_cache_rejects_unknown_attributes(self):
+        """Test that __slots__ prevents accidental attribute additions."""
+        cache = MemoryCacheProvider()
+
+        with pytest.raises(AttributeError):
+            cache.extra = True  # type: ignore[attr-defined]
+
+    def test_cache_supports_weak_references(self):
+        """Test that __slots__ still allows weak references to the cache."""
+        cache = MemoryCacheProvider()
+
+        assert weakref.ref(cache)() is cache
+
+    @pytest.mark.asyncio
+    async def test_cache_max_bytes_evicts_least_recently_used(self):
+        """Test that entries are evicted once the byte budget is exceeded."""
+        cache = MemoryCacheProvider(sweep_interval=None, max_bytes=25, sizeof=len)
+
+        await cache.set("key1", "a" * 10, ttl=60)
+        await cache.set("key2", "b" * 10, ttl=60)
+        assert cache.size() == 2
+
+        # Touch key1 so key2 becomes least recently used
+        assert await cache.get("key1") == "a" * 10
+
+        await cache.set("key3", "c" * 10, ttl=60)
+        assert await cache.get("key1") == "a" * 10
+        assert await cache.get("key2") is None
+        assert await cache.get("key3") == "c" * 10
+
+    @pytest.mark.asyncio
+    async def test_cache_max_bytes_evicts_several_entries_for_large_value(self):
+        """Test that a large value evicts as many entries as needed."""
+        cache = MemoryCacheProvider(sweep_interval=None, max_bytes=30, sizeof=len)
+
+        await cache.set("key1", "a" * 10, ttl=60)
+        await cache.set("key2", "b" * 10, ttl=60)
+        await cache.set("key3", "c" * 25, ttl=60)
+
+        assert cache.size() == 1
+        assert await cache.get("key3") == "c" * 25
+
+    @pytest.mark.asyncio
+    async def test_cache_max_bytes_skips_oversized_value(self):
+        """Test that a value larger than max_bytes is not cached and evicts nothing."""
+        cache = MemoryCacheProvider(sweep_interval=None, max_bytes=100, sizeof=len)
+
+        for i in range(5):
+            await cache.set(f"key{i}", "a" * 15, ttl=60)
+        await cache.set("key0", "b" * 15, ttl=60)
+
+        # Oversized overwrite drops the stale value; other entries survive
+        await cache.set("key0", "x" * 200, ttl=60)
+        await cache.set("huge", "x" * 200, ttl=60)
+
+        assert cache.size() == 4
+        assert cache._bytes == 60
+        assert await cache.get("key0") is None
+        assert await cache.get("huge") is None
+        for i in range(1, 5):
+            assert await cache.get(f"key{i}") == "a" * 15
+
+    @pytest.mark.asyncio
+    async def test_cache_max_bytes_tracks_overwrites_and_expiry(self):
+        """Test that byte accounting follows overwrites, expiry and clear."""
+        cache = MemoryCacheProvider(sweep_interval=None, max_bytes=100, sizeof=len)
+
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
+            mock_time.return_value = 0
+            await cache.set("key1", "a" * 10, ttl=60)
+            await cache.set("key1", "a" * 30, ttl=60)
+            await cache.set("key2", "b" * 20, ttl=1)
+            assert cache._bytes == 50
+
+            mock_time.return_value = 2
+            assert await cache.get("key2") is None
+            assert cache._bytes == 30
+
+        cache.clear()
+        assert cache._bytes == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_max_bytes_default_sizeof(self):
+        """Test that the default size estimate counts nested containers."""
+        cache = MemoryCacheProvider(sweep_interval=None, max_bytes=100_000)
+        await cache.set("key", {"verses": ["text"] * 10}, ttl=60)
+        small_size = cache._bytes
+
+        await cache.set("key", {"verses": [f"text {i}" for i in range(100)]}, ttl=60)
+        assert cache._bytes > small_size
+
+    def test_cache_sweeper_restarts_on_new_event_loop(self):
+        """Test that the sweeper restarts after the loop that owned it shuts down."""
+        cache = MemoryCacheProvider(sweep_interval=0.01)
+
+        async def first_loop():
+            await cache.set("key1", "value1", ttl=60)
+
+        async def second_loop():
+            await cache.set("key2", "value2", ttl=0)
+            await asyncio.sleep(0.05)
+            size = cache.size()
+            await cache.aclose()
+            return size
+
+        asyncio.run(first_loop())
+        assert cache._sweeper is not None
+        assert cache._sweeper.done()
+
+        # key1 is still live; expired key2 is swept by the restarted sweeper
+        assert asyncio.run(second_loop()) == 1
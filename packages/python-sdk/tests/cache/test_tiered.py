@@ -0,0 +1,156 @@
+"""Tests for TieredCacheProvider."""
+
+from unittest.mock import patch
+
+import pytest
+
+from lsbible.cache import TieredCacheProvider
+
+
+class TestTieredCacheProvider:
+    """Test TieredCacheProvider class."""
+
+    @pytest.mark.asyncio
+    async def test_set_writes_through_to_inner(self, recording_cache_provider):
+        """Test that set() writes to the inner provider."""
+        inner = recording_cache_provider
+        cache = TieredCacheProvider(inner)
+
+        await cache.set("key", "value", ttl=60)
+
+        assert inner.data == {"key": "value"}
+        assert cache.size() == 1
+
+    @pytest.mark.asyncio
+    async def test_get_served_from_memory_after_set(self, recording_cache_provider):
+        """Test that values written through the tier skip the inner provider."""
+        inner = recording_cache_provider
+        cache = TieredCacheProvider(inner)
+
+        await cache.set("key", {"verse": 16}, ttl=60)
+
+        assert await cache.get("key") == {"verse": 16}
+        assert inner.get_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_inner_hit_populates_memory(self, recording_cache_provider):
+        """Test that a hit on the inner provider is kept in memory."""
+        inner = recording_cache_provider
+        inner.data["key"] = "value"
+        cache = TieredCacheProvider(inner)
+
+        assert await cache.get("key") == "value"
+        assert await cache.get("key") == "value"
+        assert inner.get_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self, recording_cache_provider):
+        """Test that a miss on both tiers returns None."""
+        inner = recording_cache_provider
+        cache = TieredCacheProvider(inner)
+
+        assert await cache.get("missing") is None
+        assert cache.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_l1_size_bounds_memory_tier(self, recording_cache_provider):
+        """Test that the in-process tier is bounded by l1_size."""
+        inner = recording_cache_provider
+        cache = TieredCacheProvider(inner, l1_size=2)
+
+        await cache.set("key1", "value1", ttl=60)
+        await cache.set("key2", "value2", ttl=60)
+        await cache.set("key3", "value3", ttl=60)
+        assert cache.size() == 2
+
+        # Evicted entry falls back to the inner provider
+        assert await cache.get("key1") == "value1"
+        assert inner.get_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_l1_ttl_expires_inner_hits(self, recording_cache_provider):
+        """Test that entries read from the inner provider expire after l1_ttl."""
+        inner = recording_cache_provider
+        inner.data["key"] = "value"
+        cache = TieredCacheProvider(inner, l1_ttl=10)
+
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
+            mock_time.return_value = 0
+            assert await cache.get("key") == "value"
+
+            mock_time.return_value = 11
+            assert await cache.get("key") == "value"
+
+        assert inner.get_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_l1_ttl_caps_write_through_entries(self, recording_batch_cache_provider):
+        """Test that set() and mset() keep values in memory for at most l1_ttl."""
+        inner = recording_batch_cache_provider
+        cache = TieredCacheProvider(inner, l1_ttl=10)
+
+        with patch("lsbible.cache.memory.monotonic") as mock_time:
+            mock_time.return_value = 0
+            await cache.set("key1", "value1", ttl=3600)
+            await cache.mset([("key2", "value2", 3600)])
+
+            # The inner entries are dropped behind the tier's back
+            inner.data.clear()
+
+            mock_time.return_value = 5
+            assert await cache.get("key1") == "value1"
+            assert await cache.get("key2") == "value2"
+
+            mock_time.return_value = 11
+            assert await cache.get("key1") is None
+            assert await cache.get("key2") is None
+
+    @pytest.mark.asyncio
+    async def test_clear_only_clears_memory_tier(self, recording_cache_provider):
+        """Test that clear() leaves the inner provider untouched."""
+        inner = recording_cache_provider
+        cache = TieredCacheProvider(inner)
+
+        await cache.set("key", "value", ttl=60)
+        cache.clear()
+
+        assert cache.size() == 0
+        assert await cache.get("key") == "value"
+        assert inner.get_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_mget_batches_inner_misses(self, recording_batch_cache_provider):
+        """Test that only in-process misses are fetched, in one inner mget."""
+        inner = recording_batch_cache_provider
+        inner.data["key2"] = "value2"
+        cache = TieredCacheProvider(inner)
+        await cache.set("key1", "value1", ttl=60)
+
+        assert await cache.mget(["key1", "key2", "key3"]) == ["value1", "value2", None]
+        assert inner.mget_calls == [["key2", "key3"]]
+
+        # key2 is now served from memory
+        assert await cache.mget(["key1", "key2"]) == ["value1", "value2"]
+        assert len(inner.mget_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_mget_falls_back_to_inner_get(self, recording_cache_provider):
+        """Test that mget works with inner providers lacking batch support."""
+        inner = recording_cache_provider
+        inner.data["key1"] = "value1"
+        cache = TieredCacheProvider(inner)
+
+        assert await cache.mget(["key1", "key2"]) == ["value1", None]
+        assert inner.get_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_mset_writes_through(self, recording_batch_cache_provider):
+        """Test that mset uses inner batch writes and populates memory."""
+        inner = recording_batch_cache_provider
+        cache = TieredCacheProvider(inner)
+
+        await cache.mset([("key1", "value1", 60), ("key2", "value2", 60)])
+
+        assert inner.mset_calls == 1
+        assert inner.data == {"key1": "value1", "key2": "value2"}
+        assert cache.size() == 2
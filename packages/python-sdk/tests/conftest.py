@@ -1,8 +1,60 @@
 """Shared fixtures and test data for lsbible tests."""
 
+from typing import Any
+
 import pytest
 
 
+class RecordingCacheProvider:
+    """Dict-backed cache provider that records calls and write TTLs."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.ttls: dict[str, int] = {}
+        self.get_calls = 0
+        self.set_calls = 0
+
+    async def get(self, key: str) -> Any | None:
+        self.get_calls += 1
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self.set_calls += 1
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+
+class RecordingBatchCacheProvider(RecordingCacheProvider):
+    """Recording cache provider that also supports batch operations."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.mget_calls: list[list[str]] = []
+        self.mset_calls = 0
+
+    async def mget(self, keys: list[str]) -> list[Any | None]:
+        self.mget_calls.append(list(keys))
+        return [self.data.get(key) for key in keys]
+
+    async def mset(self, entries: list[tuple[str, Any, int]]) -> None:
+        self.mset_calls += 1
+        for key, value, ttl in entries:
+            self.data[key] = value
+            self.ttls[key] = ttl
+
+
+@pytest.fixture
+def recording_cache_provider():
+    """Cache provider that records calls and write TTLs."""
+    return RecordingCacheProvider()
+
+
+@pytest.fixture
+def recording_batch_cache_provider():
+    """Recording cache provider with mget/mset support."""
+    return RecordingBatchCacheProvider()
+
+
 @pytest.fixture
 def sample_homepage_html():
     """Sample homepage HTML with buildId in __NEXT_DATA__."""
@@ -1,10 +1,13 @@
 """Tests for LSBible API client."""
 
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
 import pytest
 import respx
 from httpx import Response
 
-from lsbible.cache import MemoryCacheProvider
+from lsbible.cache import CacheTTL, MemoryCacheProvider
 from lsbible.client import LSBibleClient
 from lsbible.exceptions import APIError, BuildIDError, InvalidReferenceError
 from lsbible.models import BookName
@@ -205,6 +208,73 @@ class TestLSBibleClient:
             assert api_call_count_1 == 1
             assert api_call_count_2 == 1
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cache_integration_custom_provider(
+        self, sample_homepage_html, sample_api_response, recording_cache_provider
+    ):
+        """Test caching through a provider that is awaited (not MemoryCacheProvider)."""
+        respx.get("https://read.lsbible.org/").mock(
+            return_value=Response(200, text=sample_homepage_html)
+        )
+        api_mock = respx.route(
+            method="GET",
+            url__regex=r"https://read\.lsbible\.org/_next/data/test-build-id-123/index\.json.*",
+        ).mock(return_value=Response(200, json=sample_api_response))
+
+        async with LSBibleClient(
+            cache={"provider": recording_cache_provider, "ttl": {"verse": 3600}}
+        ) as client:
+            # Miss: fetched from the API and stored with the verse TTL
+            passage1 = await client.get_verse(BookName.JOHN, 3, 16)
+            assert api_mock.call_count == 1
+            assert recording_cache_provider.ttls == {"verse:John 3:16": 3600}
+
+            # Hit: served from the provider without another API call
+            passage2 = await client.get_verse(BookName.JOHN, 3, 16)
+            assert api_mock.call_count == 1
+            assert recording_cache_provider.get_calls == 2
+            assert passage1 == passage2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cache_integration_memory_subclass(
+        self, sample_homepage_html, sample_api_response
+    ):
+        """Test that MemoryCacheProvider subclasses have their get/set overrides called."""
+        respx.get("https://read.lsbible.org/").mock(
+            return_value=Response(200, text=sample_homepage_html)
+        )
+        api_mock = respx.route(
+            method="GET",
+            url__regex=r"https://read\.lsbible\.org/_next/data/test-build-id-123/index\.json.*",
+        ).mock(return_value=Response(200, json=sample_api_response))
+
+        class CountingMemoryCacheProvider(MemoryCacheProvider):
+            __slots__ = ("get_calls", "set_calls")
+
+            def __init__(self) -> None:
+                super().__init__(sweep_interval=None)
+                self.get_calls = 0
+                self.set_calls = 0
+
+            async def get(self, key: str) -> Any | None:
+                self.get_calls += 1
+                return await super().get(key)
+
+            async def set(self, key: str, value: Any, ttl: int) -> None:
+                self.set_calls += 1
+                await super().set(key, value, ttl)
+
+        cache_provider = CountingMemoryCacheProvider()
+        async with LSBibleClient(cache={"provider": cache_provider}) as client:
+            await client.get_verse(BookName.JOHN, 3, 16)
+            await client.get_verse(BookName.JOHN, 3, 16)
+
+        assert cache_provider.get_calls == 2
+        assert cache_provider.set_calls == 1
+        assert api_mock.call_count == 1
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_clear_cache(self, sample_homepage_html, sample_api_response):
@@ -230,6 +300,74 @@ class TestLSBibleClient:
             await client.search("John 3:16")
             assert api_mock.call_count == 2
 
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_empty_response_cached_with_not_found_ttl(self, sample_homepage_html):
+        """Test that responses without passages are cached only briefly."""
+        respx.get("https://read.lsbible.org/").mock(
+            return_value=Response(200, text=sample_homepage_html)
+        )
+        api_mock = respx.route(
+            method="GET",
+            url__regex=r"https://read\.lsbible\.org/_next/data/test-build-id-123/index\.json.*",
+        ).mock(return_value=Response(200, json={"pageProps": {"passages": []}}))
+
+        cache_provider = MemoryCacheProvider(sweep_interval=None)
+        async with LSBibleClient(
+            cache={"provider": cache_provider, "ttl": {"not_found": 60}}
+        ) as client:
+            with patch("lsbible.cache.memory.monotonic") as mock_time:
+                mock_time.return_value = 0
+                with pytest.raises(APIError, match="No passage found"):
+                    await client.get_verse(BookName.JOHN, 3, 16)
+
+                # Repeated request is served from the cache
+                with pytest.raises(APIError, match="No passage found"):
+                    await client.get_verse(BookName.JOHN, 3, 16)
+                assert api_mock.call_count == 1
+
+                # After the not-found TTL, the API is queried again
+                mock_time.return_value = 61
+                with pytest.raises(APIError, match="No passage found"):
+                    await client.get_verse(BookName.JOHN, 3, 16)
+                assert api_mock.call_count == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_not_found_ttl_caps_custom_provider_writes(
+        self, sample_homepage_html, sample_api_response, recording_cache_provider
+    ):
+        """Test that awaited providers get the not-found TTL cap only for empty responses."""
+        respx.get("https://read.lsbible.org/").mock(
+            return_value=Response(200, text=sample_homepage_html)
+        )
+        responses = {
+            "John 3:16": {"pageProps": {"passages": []}},
+            "John 3:17": sample_api_response,
+            "nothing": {"pageProps": {"initialItems": [], "totalCount": 0}},
+        }
+        respx.route(
+            method="GET",
+            url__regex=r"https://read\.lsbible\.org/_next/data/test-build-id-123/index\.json.*",
+        ).mock(side_effect=lambda request: Response(200, json=responses[request.url.params["q"]]))
+
+        async with LSBibleClient(
+            cache={
+                "provider": recording_cache_provider,
+                "ttl": {"verse": 3600, "search": 600, "not_found": 60},
+            }
+        ) as client:
+            with pytest.raises(APIError, match="No passage found"):
+                await client.get_verse(BookName.JOHN, 3, 16)
+            await client.get_verse(BookName.JOHN, 3, 17)
+            await client.search("nothing")
+
+        assert recording_cache_provider.ttls == {
+            "verse:John 3:16": 60,  # min(3600, 60)
+            "verse:John 3:17": 3600,  # full TTL for a non-empty response
+            "search:nothing": 60,  # min(600, 60)
+        }
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_api_error_handling(self, sample_homepage_html):
@@ -276,6 +414,46 @@ class TestLSBibleClient:
             assert client._cache_provider is cache_provider
             assert client._build_id == "custom-id"
 
+    @pytest.mark.asyncio
+    async def test_cache_ttl_resolution(self):
+        """Test that per-operation TTLs fall back to default_ttl, then recommended values."""
+        async with LSBibleClient() as client:
+            assert client._cache_ttls == (
+                CacheTTL.BIBLE_CONTENT,
+                CacheTTL.BIBLE_CONTENT,
+                CacheTTL.BIBLE_CONTENT,
+                CacheTTL.SEARCH_RESULTS,
+                CacheTTL.NOT_FOUND,
+            )
+
+        async with LSBibleClient(
+            cache={
+                "provider": MemoryCacheProvider(),
+                "default_ttl": 3600,
+                "ttl": {"verse": 60, "not_found": 5},
+            }
+        ) as client:
+            assert client._cache_ttls == (60, 3600, 3600, 3600, 5)
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_custom_provider_open(self, recording_cache_provider):
+        """Test that closing the client doesn't close caller-owned cache providers."""
+        recording_cache_provider.aclose = AsyncMock()
+        async with LSBibleClient(cache={"provider": recording_cache_provider}):
+            pass
+
+        recording_cache_provider.aclose.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_close_stops_cache_sweeper(self):
+        """Test that closing the client stops the memory cache sweeper."""
+        cache_provider = MemoryCacheProvider()
+        async with LSBibleClient(cache={"provider": cache_provider}):
+            await cache_provider.set("key", "value", ttl=60)
+            assert cache_provider._sweeper is not None
+
+        assert cache_provider._sweeper is None
+
     @pytest.mark.asyncio
     @respx.mock
     async def test_api_request_headers(self, sample_homepage_html, sample_api_response):